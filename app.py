@@ -1,19 +1,68 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import yfinance as yf
 from datetime import datetime, timedelta
 import requests
-from fredapi import Fred
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3Error
+from selectolax.lexbor import LexborHTMLParser
+import ijson
 import re
 import json
+import functools
+import os
+import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
+# PMI 스크래핑용 정규식/셀렉터 (모듈 로드 시 한 번만 컴파일)
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+_SCRIPT_KEYWORD_RE = re.compile(r'series|data', re.IGNORECASE)
+_JSON_ARRAY_PATTERNS = (
+    re.compile(r'series.*?(\[.*?\])', re.DOTALL),
+    re.compile(r'data.*?(\[.*?\])', re.DOTALL),
+    re.compile(r'values.*?(\[.*?\])', re.DOTALL),
+)
+_PMI_SELECTORS = (
+    'span[data-last]',
+    '.ticker-value',
+    '.actual-value',
+    '.current-value',
+    '#p',
+    '.te-value',
+)
+
+# 외부 요청 동시성/타임아웃 (스레드 수와 연결 풀 크기를 함께 맞춤)
+_HTTP_MAX_WORKERS = 4
+_HTTP_TIMEOUT = 15
+
+# FRED 시리즈 디스크 캐시 (프로세스 재시작 후에도 유지, Streamlit Cloud에서는 /tmp 사용)
+FRED_CACHE_DIR = os.environ.get('FRED_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'crisis_alert_cache'))
+FRED_CACHE_MAX_AGE = timedelta(hours=1)
+FRED_FAILURE_TTL = timedelta(minutes=5)
+FRED_START_DATE = '2020-01-01'
+
+# 2023-2024년 실제 PMI 데이터 (Trading Economics 기반, 마지막 달은 실시간 값으로 채움)
+ACTUAL_PMI_HISTORY = np.array([
+    # 2023년 데이터
+    47.4, 47.7, 46.3, 46.9, 46.9, 46.0, 46.4, 47.6, 49.0, 46.7, 46.7, 47.1,
+    # 2024년 데이터 (최신까지)
+    49.1, 49.1, 50.3, 49.2, 48.7, 48.5, 49.2, 49.0, 49.2, 49.0, 48.7,
+])
+
+# 2024년 실제 PMI 데이터 기반 백업 추세
+FALLBACK_PMI_TREND = np.array([
+    52.4, 51.9, 51.8, 50.9, 49.7, 48.5, 47.8,
+    48.9, 49.2, 48.7, 49.1, 48.2, 49.8,
+])
+
+# 차트에 그릴 최대 점 개수 (초과 시 LTTB 다운샘플링)
+CHART_MAX_POINTS = 500
+
 # 페이지 설정
 st.set_page_config(
     page_title="🚨 경제 위기 시그널 체크",
@@ -81,187 +130,328 @@ if not fred_api_key:
     st.warning("FRED API 키를 입력해주세요. https://fred.stlouisfed.org/docs/api/api_key.html 에서 무료로 발급받을 수 있습니다.")
     st.stop()
 
-# FRED API 초기화
-fred = Fred(api_key=fred_api_key)
+# FRED API 엔드포인트 (JSON 관측값)
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+@st.cache_resource
+def get_http_session():
+    """연결 풀을 재사용하는 공용 HTTP 세션 (스크립트 재실행 간 유지)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_MAX_WORKERS,
+        pool_maxsize=_HTTP_MAX_WORKERS * 2,
+        max_retries=Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    return session
+
+def request_fred_observations(series_id, observation_start):
+    """FRED JSON 엔드포인트에서 observation_start 이후 관측값 가져오기"""
+    params = {
+        'series_id': series_id,
+        'api_key': fred_api_key,
+        'file_type': 'json',
+        'observation_start': observation_start
+    }
+    dates, values = [], []
+    error_message = None
+    try:
+        with get_http_session().get(FRED_OBSERVATIONS_URL, params=params, timeout=_HTTP_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                error_message = response.json().get('error_message', f"HTTP {response.status_code}")
+            else:
+                # 응답 전체를 파이썬 객체로 만들지 않고 관측값을 하나씩 스트리밍으로 읽음
+                response.raw.decode_content = True
+                for o in ijson.items(response.raw, 'observations.item'):
+                    # 결측값은 '.' 으로 내려오므로 제외
+                    if o['value'] != '.':
+                        dates.append(o['date'])
+                        values.append(o['value'])
+    except (requests.RequestException, Urllib3Error, ijson.JSONError, ValueError) as e:
+        # 예외 메시지의 URL에 API 키가 포함되므로 노출하지 않음
+        raise ValueError(f"FRED 요청 실패 ({type(e).__name__})") from None
+    
+    if error_message:
+        raise ValueError(error_message)
+    
+    dates = np.array(dates, dtype='datetime64[D]')
+    values = np.array(values, dtype=np.float64)
+    # Arrow 기반 float64 로 보관 (parquet 캐시와 그대로 호환)
+    return pd.Series(values, index=pd.DatetimeIndex(dates), dtype='float64[pyarrow]')
+
+def read_cached_series(path):
+    """디스크 캐시에서 시리즈 읽기 (없거나 손상되면 None)"""
+    try:
+        return pd.read_parquet(path)['value'].rename(None)
+    except Exception:
+        return None
+
+def write_cached_series(path, series):
+    """디스크 캐시에 시리즈 저장 (쓰기 실패는 무시)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        series.to_frame('value').to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+@st.cache_resource
+def get_fred_failures():
+    """디스크 캐시 없이 실패한 FRED 요청 기록 (FRED_FAILURE_TTL 동안 재요청하지 않음)"""
+    return {}
 
 @st.cache_data(ttl=3600)  # 1시간 캐시
+def fetch_fred_series(series_id):
+    """FRED 시리즈 원본 데이터 가져오기 (디스크 캐시 + 증분 요청, 실패 시 예외 발생)"""
+    path = os.path.join(FRED_CACHE_DIR, f"{series_id}.parquet")
+    cached = read_cached_series(path)
+    
+    if cached is None or cached.empty:
+        # 최근 실패한 시리즈는 재실행마다 타임아웃을 기다리지 않도록 바로 실패 처리
+        failures = get_fred_failures()
+        failure = failures.get(series_id)
+        if failure and datetime.now() - failure[0] < FRED_FAILURE_TTL:
+            raise ValueError(failure[1])
+        try:
+            series = request_fred_observations(series_id, FRED_START_DATE)
+        except Exception as e:
+            failures[series_id] = (datetime.now(), str(e))
+            raise
+        failures.pop(series_id, None)
+    else:
+        # 최근에 갱신된 캐시는 그대로 사용
+        cache_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(path))
+        if cache_age < FRED_CACHE_MAX_AGE:
+            return cached
+        
+        # 마지막 관측일 이후 데이터만 요청
+        observation_start = (cached.index[-1] + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        try:
+            new_data = request_fred_observations(series_id, observation_start)
+        except Exception:
+            # 요청 실패 시 기존 캐시 사용 (mtime 이 그대로라 다음 호출에서 다시 시도)
+            return cached
+        series = pd.concat([cached, new_data])
+        series = series[~series.index.duplicated(keep='last')]
+    
+    write_cached_series(path, series)
+    return series
+
+def invalidate_fred_series(series_id):
+    """시리즈의 메모리 캐시를 비우고 디스크 캐시를 만료 처리 (다음 호출 시 증분 요청)"""
+    fetch_fred_series.clear(series_id)
+    get_fred_failures().pop(series_id, None)
+    try:
+        os.utime(os.path.join(FRED_CACHE_DIR, f"{series_id}.parquet"), (0, 0))
+    except OSError:
+        pass
+
+@st.cache_data(ttl=1800)  # 30분 캐시
+def fetch_pmi_html():
+    """Trading Economics PMI 페이지 HTML 가져오기 (요청/응답 실패 시 None, 실패도 TTL 동안 캐시)"""
+    url = "https://tradingeconomics.com/united-states/manufacturing-pmi"
+    headers = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0'
+    }
+    
+    try:
+        response = get_http_session().get(url, headers=headers, timeout=_HTTP_TIMEOUT)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    return response.text
+
+def load_all_series():
+    """FRED 시리즈와 PMI 페이지를 병렬로 가져오기
+    
+    작업 스레드에 현재 스크립트 컨텍스트를 붙여 fetch_* 캐시에 결과가 저장되게 하고,
+    시리즈별 결과(실패 시 예외 객체)를 dict로 반환한다.
+    """
+    jobs = {
+        'SOFR': (fetch_fred_series, 'SOFR'),
+        'GS10': (fetch_fred_series, 'GS10'),
+        'GS2': (fetch_fred_series, 'GS2'),
+        'PMI': (fetch_pmi_html,),
+    }
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=_HTTP_MAX_WORKERS,
+                            initializer=functools.partial(add_script_run_ctx, None, ctx)) as executor:
+        futures = {name: executor.submit(*job) for name, job in jobs.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = e
+    return results
+
+def take_prefetched(name, fetch, *args):
+    """이번 실행에서 병렬로 가져온 결과 꺼내기 (없으면 직접 가져오고, 실패였으면 예외 다시 발생)
+    
+    결과는 한 번만 사용되므로 패널 단위 재실행에서는 항상 fetch 를 호출한다.
+    """
+    prefetched = st.session_state.get('prefetched', {})
+    if name not in prefetched:
+        return fetch(*args)
+    result = prefetched.pop(name)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
 def get_sofr_data():
     """SOFR 데이터 가져오기"""
     try:
-        sofr = fred.get_series('SOFR', start='2020-01-01')
-        return sofr.dropna()
+        return take_prefetched('SOFR', fetch_fred_series, 'SOFR')
     except Exception as e:
         st.error(f"SOFR 데이터 로드 실패: {e}")
         return None
 
-@st.cache_data(ttl=1800)  # 30분 캐시 (PMI는 더 자주 업데이트)
-def get_pmi_data_alternative():
-    """Trading Economics에서 실제 PMI 데이터 가져오기"""
-    
-    try:
-        url = "https://tradingeconomics.com/united-states/manufacturing-pmi"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
+@st.cache_data(max_entries=1)  # 스크립트 재실행 간 유지, 날짜가 바뀌면 교체
+def pmi_dates(today):
+    """PMI 시계열용 월말 날짜 (2023-01 부터 today 까지, 날짜별로 한 번만 생성)"""
+    return pd.date_range(start='2023-01-01', end=today, freq='ME')
+
+def find_pmi_in_selectors(tree):
+    """방법 1: 메인 값 표시 영역에서 PMI 찾기"""
+    for selector in _PMI_SELECTORS:
+        element = tree.css_first(selector)
+        if element:
+            # 숫자와 소수점만 추출
+            match = _NUM_RE.search(element.text().strip())
+            if match:
+                try:
+                    val = float(match.group(1))
+                except (ValueError, TypeError):
+                    continue
+                if 30 <= val <= 80:  # PMI 범위 검증
+                    st.success(f"PMI 데이터 성공적으로 가져옴: {val}")
+                    return val
+    return None
+
+def find_pmi_in_scripts(tree):
+    """방법 2: JSON 스크립트의 차트 데이터에서 PMI 찾기"""
+    # src 속성이 있는 외부 스크립트는 본문이 없으므로 인라인 스크립트만 순회
+    for script in tree.css('script:not([src])'):
+        script_text = script.text()
+        if not script_text or not _SCRIPT_KEYWORD_RE.search(script_text):
+            continue
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 현재 PMI 값 찾기 - 여러 방법 시도
-            current_value = None
-            
-            # 방법 1: 메인 값 표시 영역에서 찾기
-            main_selectors = [
-                'span[data-last]',
-                '.ticker-value',
-                '.actual-value',
-                '.current-value',
-                '#p',
-                '.te-value'
-            ]
-            
-            for selector in main_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    try:
-                        text = element.get_text().strip()
-                        # 숫자와 소수점만 추출
-                        match = re.search(r'(\d+\.?\d*)', text)
-                        if match:
-                            try:
-                                val = float(match.group(1))
-                                if 30 <= val <= 80:  # PMI 범위 검증
-                                    current_value = val
-                                    st.success(f"PMI 데이터 성공적으로 가져옴: {current_value}")
-                                    break
-                            except (ValueError, TypeError):
-                                continue
-                    except:
-                        continue
-            
-            # 방법 2: JSON 스크립트에서 차트 데이터 찾기
-            if not current_value:
-                scripts = soup.find_all('script')
-                for script in scripts:
-                    if script.string and ('series' in script.string.lower() or 'data' in script.string.lower()):
-                        try:
-                            # JSON 데이터 패턴 찾기
-                            json_patterns = [
-                                r'series.*?(\[.*?\])',
-                                r'data.*?(\[.*?\])',
-                                r'values.*?(\[.*?\])'
-                            ]
-                            
-                            for pattern in json_patterns:
-                                json_match = re.search(pattern, script.string, re.DOTALL)
-                                if json_match:
-                                    json_str = json_match.group(1)
-                                    data = json.loads(json_str)
-                                    if data and len(data) > 0:
-                                        # 마지막 값 추출
-                                        if isinstance(data[-1], (int, float)):
-                                            current_value = float(data[-1])
-                                        elif isinstance(data[-1], list) and len(data[-1]) > 1:
-                                            current_value = float(data[-1][1])
-                                        else:
-                                            current_value = None
-                                        
-                                        if current_value is not None and 30 <= current_value <= 80:
-                                            st.success(f"PMI 차트 데이터에서 가져옴: {current_value}")
-                                            break
-                        except:
-                            continue
-            
-            # 방법 3: 테이블에서 최신 데이터 찾기
-            if not current_value:
-                tables = soup.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        for cell in cells:
-                            text = cell.get_text().strip()
-                            match = re.search(r'(\d+\.?\d*)', text)
-                            if match:
-                                try:
-                                    val = float(match.group(1))
-                                    if 30 <= val <= 80:
-                                        current_value = val
-                                        st.success(f"PMI 테이블에서 가져옴: {current_value}")
-                                        break
-                                except (ValueError, TypeError):
-                                    continue
-                        if current_value:
-                            break
-            
-            # 실제 데이터를 찾았으면 시계열 구성
-            if current_value:
-                # 최근 24개월 데이터 구성 (실제 데이터 기반)
-                dates = pd.date_range(start='2023-01-01', end=datetime.now(), freq='M')
-                
-                # 2023-2024년 실제 PMI 데이터 (Trading Economics 기반)
-                actual_pmi_data = [
-                    # 2023년 데이터
-                    47.4, 47.7, 46.3, 46.9, 46.9, 46.0, 46.4, 47.6, 49.0, 46.7, 46.7, 47.1,
-                    # 2024년 데이터 (최신까지)
-                    49.1, 49.1, 50.3, 49.2, 48.7, 48.5, 49.2, 49.0, 49.2, 49.0, 48.7, current_value
-                ]
-                
-                # 날짜 수에 맞게 조정
-                if len(dates) > len(actual_pmi_data):
-                    # 부족한 데이터는 최근 추세로 채움
-                    last_values = actual_pmi_data[-6:]  # 최근 6개월
-                    extended_data = actual_pmi_data + (last_values * ((len(dates) - len(actual_pmi_data)) // len(last_values) + 1))
-                    pmi_values = extended_data[:len(dates)]
+        # JSON 데이터 패턴 찾기
+        for pattern in _JSON_ARRAY_PATTERNS:
+            json_match = pattern.search(script_text)
+            if not json_match:
+                continue
+            try:
+                data = json.loads(json_match.group(1))
+                # 마지막 값 추출
+                if isinstance(data[-1], (int, float)):
+                    val = float(data[-1])
+                elif isinstance(data[-1], list) and len(data[-1]) > 1:
+                    val = float(data[-1][1])
                 else:
-                    pmi_values = actual_pmi_data[-len(dates):]
-                
-                # 마지막 값은 실제 현재 값으로 설정
-                pmi_values[-1] = current_value
-                
-                return pd.Series(pmi_values, index=dates)
-            else:
-                st.warning("Trading Economics에서 PMI 값을 찾을 수 없습니다.")
-                
-    except Exception as e:
-        st.warning(f"Trading Economics 데이터 로드 실패: {e}")
+                    continue
+            except (ValueError, TypeError, IndexError, KeyError):
+                continue
+            
+            if 30 <= val <= 80:
+                st.success(f"PMI 차트 데이터에서 가져옴: {val}")
+                return val
+    return None
+
+def find_pmi_in_tables(tree):
+    """방법 3: 테이블에서 최신 PMI 찾기"""
+    for cell in tree.css('table td, table th'):
+        match = _NUM_RE.search(cell.text().strip())
+        if match:
+            try:
+                val = float(match.group(1))
+            except (ValueError, TypeError):
+                continue
+            if 30 <= val <= 80:
+                st.success(f"PMI 테이블에서 가져옴: {val}")
+                return val
+    return None
+
+@st.cache_data(ttl=1800)  # 30분 캐시
+def scrape_pmi_series(html):
+    """Trading Economics 페이지에서 현재 PMI를 찾아 시계열 구성 (실패 시 None)"""
+    tree = LexborHTMLParser(html)
     
-    # 백업: 시뮬레이션된 데이터 (실제 데이터가 없을 때만 사용)
-    st.info("실시간 PMI 데이터 연결 실패. 시뮬레이션된 데이터를 사용합니다.")
-    dates = pd.date_range(start='2023-01-01', end=datetime.now(), freq='M')
+    # 여러 방법을 순서대로 시도하고 처음 찾은 값 사용
+    for finder in (find_pmi_in_selectors, find_pmi_in_scripts, find_pmi_in_tables):
+        current_value = finder(tree)
+        if current_value is not None:
+            break
+    else:
+        st.warning("Trading Economics에서 PMI 값을 찾을 수 없습니다.")
+        return None
     
-    # 2024년 실제 PMI 데이터 기반 백업
-    realistic_pmi_data = [
-        52.4, 51.9, 51.8, 50.9, 49.7, 48.5, 47.8, 
-        48.9, 49.2, 48.7, 49.1, 48.2, 49.8
-    ]
+    # 최근 24개월 데이터 구성 (실제 데이터 기반)
+    dates = pmi_dates(datetime.now().date())
+    actual_pmi_data = np.append(ACTUAL_PMI_HISTORY, current_value)
     
-    if len(dates) > len(realistic_pmi_data):
-        extended_data = realistic_pmi_data * (len(dates) // len(realistic_pmi_data) + 1)
-        pmi_values = extended_data[:len(dates)]
+    # 날짜 수에 맞게 조정
+    if len(dates) > actual_pmi_data.size:
+        # 부족한 데이터는 최근 추세로 채움
+        last_values = actual_pmi_data[-6:]  # 최근 6개월
+        reps = -(-(len(dates) - actual_pmi_data.size) // last_values.size)
+        pmi_values = np.concatenate([actual_pmi_data, np.tile(last_values, reps)])[:len(dates)]
     else:
-        pmi_values = realistic_pmi_data[-len(dates):]
+        pmi_values = actual_pmi_data[-len(dates):]
+    
+    # 마지막 값은 실제 현재 값으로 설정
+    pmi_values[-1] = current_value
     
     return pd.Series(pmi_values, index=dates)
 
-@st.cache_data(ttl=3600)
+def fallback_pmi_series():
+    """백업: 시뮬레이션된 PMI 시계열 (실제 데이터가 없을 때만 사용)"""
+    dates = pmi_dates(datetime.now().date())
+    
+    if len(dates) > FALLBACK_PMI_TREND.size:
+        reps = -(-len(dates) // FALLBACK_PMI_TREND.size)
+        pmi_values = np.tile(FALLBACK_PMI_TREND, reps)[:len(dates)]
+    else:
+        pmi_values = FALLBACK_PMI_TREND[-len(dates):].copy()
+    
+    return pd.Series(pmi_values, index=dates)
+
+def get_pmi_data_alternative():
+    """Trading Economics에서 실제 PMI 데이터 가져오기"""
+    try:
+        html = take_prefetched('PMI', fetch_pmi_html)
+        pmi_series = scrape_pmi_series(html) if html else None
+        if pmi_series is not None:
+            return pmi_series
+    except Exception as e:
+        st.warning(f"Trading Economics 데이터 로드 실패: {e}")
+    
+    st.info("실시간 PMI 데이터 연결 실패. 시뮬레이션된 데이터를 사용합니다.")
+    return fallback_pmi_series()
+
 def get_yield_curve_data():
     """수익률 곡선 데이터 가져오기"""
     try:
         # 10년물 - 2년물 스프레드
-        ten_year = fred.get_series('GS10', start='2020-01-01')
-        two_year = fred.get_series('GS2', start='2020-01-01')
+        ten_year = take_prefetched('GS10', fetch_fred_series, 'GS10')
+        two_year = take_prefetched('GS2', fetch_fred_series, 'GS2')
+        
+        # 두 시리즈 모두 결측값이 없으므로, 날짜가 같으면 정렬 없이 바로 계산
+        if ten_year.index.equals(two_year.index):
+            return pd.Series(ten_year.to_numpy() - two_year.to_numpy(), index=ten_year.index, dtype=ten_year.dtype)
         
         # 공통 인덱스로 정렬
         yield_spread = ten_year - two_year
@@ -270,17 +460,41 @@ def get_yield_curve_data():
         st.error(f"수익률 곡선 데이터 로드 실패: {e}")
         return None
 
+def refresh_sofr_data():
+    """SOFR: 영업일 기준 다음날 발표 (마지막 관측일 + 2영업일이면 새 값 존재)"""
+    sofr_data = get_sofr_data()
+    if sofr_data is None or sofr_data.index[-1] + pd.offsets.BDay(2) <= pd.Timestamp.today().normalize():
+        invalidate_fred_series('SOFR')
+
+def refresh_yield_curve_data():
+    """GS10/GS2: 월간 평균, 다음 달 초 발표 (마지막 관측월 + 2개월이면 새 값 존재)"""
+    yield_data = get_yield_curve_data()
+    if yield_data is None or yield_data.index[-1] + pd.DateOffset(months=2) <= pd.Timestamp.today().normalize():
+        invalidate_fred_series('GS10')
+        invalidate_fred_series('GS2')
+
+def refresh_pmi_data():
+    """PMI: 스크래핑 값이라 관측일로 판단할 수 없으므로 항상 갱신"""
+    fetch_pmi_html.clear()
+
+def refresh_stale_data():
+    """발표 주기상 새 데이터가 있을 수 있는 지표만 캐시 비우기"""
+    refresh_sofr_data()
+    refresh_yield_curve_data()
+    refresh_pmi_data()
+
 def analyze_sofr_signal(sofr_data):
     """SOFR 위기 시그널 분석"""
     if sofr_data is None or len(sofr_data) < 2:
         return None, None
     
-    current_rate = sofr_data.iloc[-1]
-    previous_rate = sofr_data.iloc[-2]
+    values = sofr_data.to_numpy(copy=False)
+    current_rate = values[-1]
+    previous_rate = values[-2]
     daily_change = current_rate - previous_rate
     
     # 최근 30일 평균과 비교
-    recent_avg = sofr_data.tail(30).mean()
+    recent_avg = values[-30:].mean()
     deviation_from_avg = current_rate - recent_avg
     
     signal = "정상"
@@ -303,12 +517,13 @@ def analyze_pmi_signal(pmi_data):
     if pmi_data is None or len(pmi_data) < 3:
         return None, None
     
-    current_pmi = pmi_data.iloc[-1]
-    recent_3_months = pmi_data.tail(3)
+    values = pmi_data.to_numpy(copy=False)
+    current_pmi = values[-1]
+    recent_3_months = values[-3:]
     
     signal = "정상"
     if current_pmi < 45:
-        if all(recent_3_months < 45):
+        if (recent_3_months < 45).all():
             signal = "경제위기 현실화"
         else:
             signal = "경고"
@@ -326,10 +541,10 @@ def analyze_yield_curve_signal(yield_data):
     if yield_data is None or len(yield_data) < 30:
         return None, None
     
-    current_spread = yield_data.iloc[-1]
-    recent_30_days = yield_data.tail(30)
-    change_30_days = current_spread - yield_data.iloc[-30]
-    change_60_days = current_spread - yield_data.iloc[-60] if len(yield_data) >= 60 else 0
+    values = yield_data.to_numpy(copy=False)
+    current_spread = values[-1]
+    change_30_days = current_spread - values[-30]
+    change_60_days = current_spread - values[-60] if len(values) >= 60 else 0
     
     signal = "정상"
     is_inverted = current_spread < 0
@@ -337,7 +552,7 @@ def analyze_yield_curve_signal(yield_data):
     
     if is_inverted:
         signal = "일드커브 역전 (경기침체 예고)"
-    elif change_30_days > 0.5 and yield_data.iloc[-30] < 0:
+    elif change_30_days > 0.5 and values[-30] < 0:
         # 역전 상태에서 빠른 정상화
         signal = "경기침체 임박 (급격한 정상화)"
         rapid_normalization = True
@@ -367,12 +582,192 @@ def analyze_yield_curve_signal(yield_data):
         'rapid_normalization_periods': rapid_normalization_periods
     }, yield_data
 
-# 데이터 로드
-with st.spinner("데이터를 로드하는 중..."):
+def lttb_indices(x, y, threshold):
+    """LTTB(Largest-Triangle-Three-Buckets) 다운샘플링으로 남길 인덱스 계산"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
     
-    # SOFR 지표
+    # 첫/마지막 점은 고정, 나머지를 threshold - 2 개 버킷으로 분할
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # 이전 선택점, 다음 버킷 평균점과 이루는 삼각형 넓이가 최대인 점 선택
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    
+    return selected
+
+def downsample_series(series, max_points):
+    """차트용으로 시계열을 max_points 개 이하로 축소"""
+    if len(series) <= max_points:
+        return series
+    # 넓이 비교만 하므로 x 의 단위는 무관 (첫 시점 기준 상대값)
+    x = (series.index.asi8 - series.index.asi8[0]).astype(np.float64)
+    idx = lttb_indices(x, series.to_numpy(dtype=np.float64), max_points)
+    return series.iloc[idx]
+
+def series_fingerprint(series):
+    """차트 캐시 키용 시리즈 요약 (전체 시리즈 해싱 회피)"""
+    return (series.index[0], series.index[-1], len(series), float(series.iloc[-1]))
+
+@st.cache_data(ttl=3600, hash_funcs={pd.Series: series_fingerprint})
+def build_sofr_fig(sofr_data):
+    """SOFR 차트 생성"""
+    plot_data = downsample_series(sofr_data, CHART_MAX_POINTS)
+    fig_sofr = go.Figure()
+    fig_sofr.add_trace(go.Scatter(
+        x=plot_data.index, 
+        y=plot_data.to_numpy(),
+        mode='lines',
+        name='SOFR',
+        line=dict(color='blue', width=2)
+    ))
+    fig_sofr.update_layout(
+        title="SOFR 금리 추이",
+        xaxis_title="날짜",
+        yaxis_title="금리 (%)",
+        height=300
+    )
+    return fig_sofr
+
+@st.cache_data(ttl=1800)  # PMI 는 점이 적으므로 시리즈 전체로 해싱
+def build_pmi_fig(pmi_data):
+    """PMI 차트 생성"""
+    fig_pmi = go.Figure()
+    fig_pmi.add_trace(go.Bar(
+        x=pmi_data.index, 
+        y=pmi_data.values,
+        name='PMI',
+        marker_color='green',
+        opacity=0.7
+    ))
+    fig_pmi.add_hline(y=50, line_dash="dash", line_color="black", 
+                    annotation_text="기준선 (50)")
+    fig_pmi.add_hline(y=45, line_dash="dash", line_color="red", 
+                    annotation_text="위기선 (45)")
+    fig_pmi.update_layout(
+        title="제조업 PMI 추이",
+        xaxis_title="날짜",
+        yaxis_title="PMI",
+        height=300,
+        showlegend=True
+    )
+    return fig_pmi
+
+@st.cache_data(ttl=3600, hash_funcs={pd.Series: series_fingerprint})
+def build_yield_fig(yield_data, inversion_periods, rapid_normalization_periods):
+    """일드커브 차트 생성"""
+    plot_data = downsample_series(yield_data, CHART_MAX_POINTS)
+    fig_yield = go.Figure()
+
+    # 메인 일드커브 라인
+    fig_yield.add_trace(go.Scatter(
+        x=plot_data.index, 
+        y=plot_data.to_numpy(),
+        mode='lines',
+        name='10Y-2Y 스프레드',
+        line=dict(color='purple', width=1.5),
+        hovertemplate='날짜: %{x}<br>스프레드: %{y:.2f}%p<extra></extra>'
+    ))
+
+    # 0선 (역전 기준선)
+    fig_yield.add_hline(y=0, line_dash="dash", line_color="red", 
+                      annotation_text="역전선 (0%p)")
+
+    # 역전 구간과 경기침체 예상 구간 하이라이트
+    if inversion_periods:
+        for i, period in enumerate(inversion_periods):
+            # 역전 구간 (연한 빨간색)
+            fig_yield.add_vrect(
+                x0=period['inversion_start'],
+                x1=period['inversion_end'],
+                fillcolor="rgba(255, 0, 0, 0.1)",
+                layer="below",
+                line_width=0,
+                annotation_text=f"역전 {period['duration_days']}일" if i == 0 else "",
+                annotation_position="top left"
+            )
+
+            # 6-18개월 후 경기침체 예상 구간 (진한 빨간색)
+            if period['recession_period_start'] <= yield_data.index[-1]:
+                fig_yield.add_vrect(
+                    x0=period['recession_period_start'],
+                    x1=min(period['recession_period_start'], yield_data.index[-1]),
+                    fillcolor="rgba(255, 0, 0, 0.3)",
+                    layer="below",
+                    line_width=0,
+                    annotation_text="침체 예상구간" if i == 0 else "",
+                    annotation_position="bottom left"
+                )
+
+    # 급격한 정상화 구간 하이라이트 (오렌지)
+    if rapid_normalization_periods:
+        for period in rapid_normalization_periods:
+            fig_yield.add_vrect(
+                x0=period['start'],
+                x1=period['end'],
+                fillcolor="rgba(255, 165, 0, 0.4)",
+                layer="below",
+                line_width=0,
+                annotation_text=f"급격한 정상화 (+{period['change']:.1f}%p)",
+                annotation_position="top right"
+            )
+
+    # 현재 상태 포인트 강조
+    current_date = yield_data.index[-1]
+    current_value = yield_data.iloc[-1]
+
+    color = "red" if current_value < 0 else "green"
+    fig_yield.add_trace(go.Scatter(
+        x=[current_date],
+        y=[current_value],
+        mode='markers',
+        name='현재 상태',
+        marker=dict(color=color, size=10, symbol='diamond'),
+        hovertemplate=f'현재: {current_value:.2f}%p<extra></extra>'
+    ))
+
+    fig_yield.update_layout(
+        title="일드커브 스프레드 추이 (10년 데이터)",
+        xaxis_title="날짜",
+        yaxis_title="스프레드 (%p)",
+        height=400,
+        showlegend=True,
+        legend=dict(x=0.02, y=0.98),
+        hovermode='x unified'
+    )
+
+    # Y축 범위 조정
+    y_min = min(yield_data.min() - 0.5, -1)
+    y_max = max(yield_data.max() + 0.5, 3)
+    fig_yield.update_yaxes(range=[y_min, y_max])
+    return fig_yield
+
+def rerun_after_refresh(state_key, new_analysis):
+    """패널 새로고침 후 재실행 (시그널이 바뀌면 종합 시그널도 갱신되도록 앱 전체 재실행)"""
+    old_analysis = st.session_state.get(state_key)
+    old_signal = old_analysis['signal'] if old_analysis else None
+    new_signal = new_analysis['signal'] if new_analysis else None
+    st.rerun(scope="fragment" if new_signal == old_signal else "app")
+
+@st.fragment
+def sofr_panel():
+    """SOFR 패널 (새로고침 시 이 패널만 재실행)"""
     st.subheader("📊 SOFR 단기자금시장 금리")
-    sofr_analysis, sofr_data = analyze_sofr_signal(get_sofr_data())
+    with st.spinner("데이터를 로드하는 중..."):
+        sofr_analysis, sofr_data = analyze_sofr_signal(get_sofr_data())
+    st.session_state['sofr_analysis'] = sofr_analysis
     
     if sofr_analysis:
         col1, col2 = st.columns([1, 2])  # 1:3 비율로 분석결과와 차트 배치
@@ -399,27 +794,19 @@ with st.spinner("데이터를 로드하는 중..."):
         with col2:
             # SOFR 차트
             if sofr_data is not None:
-                fig_sofr = go.Figure()
-                fig_sofr.add_trace(go.Scatter(
-                    x=sofr_data.index, 
-                    y=sofr_data.values,
-                    mode='lines',
-                    name='SOFR',
-                    line=dict(color='blue', width=2)
-                ))
-                fig_sofr.update_layout(
-                    title="SOFR 금리 추이",
-                    xaxis_title="날짜",
-                    yaxis_title="금리 (%)",
-                    height=300
-                )
-                st.plotly_chart(fig_sofr, use_container_width=True)
+                st.plotly_chart(build_sofr_fig(sofr_data), use_container_width=True)
     
-    st.markdown("---")
-    
-    # PMI 지표
+    if st.button("🔄 SOFR 새로고침", key="refresh_sofr"):
+        refresh_sofr_data()
+        rerun_after_refresh('sofr_analysis', analyze_sofr_signal(get_sofr_data())[0])
+
+@st.fragment
+def pmi_panel():
+    """PMI 패널 (새로고침 시 이 패널만 재실행)"""
     st.subheader("🏭 제조업 PMI")
-    pmi_analysis, pmi_data = analyze_pmi_signal(get_pmi_data_alternative())
+    with st.spinner("데이터를 로드하는 중..."):
+        pmi_analysis, pmi_data = analyze_pmi_signal(get_pmi_data_alternative())
+    st.session_state['pmi_analysis'] = pmi_analysis
     
     if pmi_analysis:
         col1, col2 = st.columns([1, 2])  # 1:3 비율로 분석결과와 차트 배치
@@ -441,32 +828,19 @@ with st.spinner("데이터를 로드하는 중..."):
         with col2:
             # PMI 차트
             if pmi_data is not None:
-                fig_pmi = go.Figure()
-                fig_pmi.add_trace(go.Bar(
-                    x=pmi_data.index, 
-                    y=pmi_data.values,
-                    name='PMI',
-                    marker_color='green',
-                    opacity=0.7
-                ))
-                fig_pmi.add_hline(y=50, line_dash="dash", line_color="black", 
-                                annotation_text="기준선 (50)")
-                fig_pmi.add_hline(y=45, line_dash="dash", line_color="red", 
-                                annotation_text="위기선 (45)")
-                fig_pmi.update_layout(
-                    title="제조업 PMI 추이",
-                    xaxis_title="날짜",
-                    yaxis_title="PMI",
-                    height=300,
-                    showlegend=True
-                )
-                st.plotly_chart(fig_pmi, use_container_width=True)
-    
-    st.markdown("---")
+                st.plotly_chart(build_pmi_fig(pmi_data), use_container_width=True)
     
-    # 일드커브 지표
+    if st.button("🔄 PMI 새로고침", key="refresh_pmi"):
+        refresh_pmi_data()
+        rerun_after_refresh('pmi_analysis', analyze_pmi_signal(get_pmi_data_alternative())[0])
+
+@st.fragment
+def yield_curve_panel():
+    """일드커브 패널 (새로고침 시 이 패널만 재실행)"""
     st.subheader("📈 일드커브 (10Y-2Y)")
-    yield_analysis, yield_data = analyze_yield_curve_signal(get_yield_curve_data())
+    with st.spinner("데이터를 로드하는 중..."):
+        yield_analysis, yield_data = analyze_yield_curve_signal(get_yield_curve_data())
+    st.session_state['yield_analysis'] = yield_analysis
     
     if yield_analysis:
         col1, col2 = st.columns([1, 2])  # 1:3 비율로 분석결과와 차트 배치
@@ -507,96 +881,38 @@ with st.spinner("데이터를 로드하는 중..."):
         with col2:
             # 고급 일드커브 차트 - 10년 데이터
             if yield_data is not None:
-                fig_yield = go.Figure()
-                
-                # 메인 일드커브 라인
-                fig_yield.add_trace(go.Scatter(
-                    x=yield_data.index, 
-                    y=yield_data.values,
-                    mode='lines',
-                    name='10Y-2Y 스프레드',
-                    line=dict(color='purple', width=1.5),
-                    hovertemplate='날짜: %{x}<br>스프레드: %{y:.2f}%p<extra></extra>'
-                ))
-                
-                # 0선 (역전 기준선)
-                fig_yield.add_hline(y=0, line_dash="dash", line_color="red", 
-                                  annotation_text="역전선 (0%p)")
-                
-                # 역전 구간과 경기침체 예상 구간 하이라이트
-                if yield_analysis['inversion_periods']:
-                    for i, period in enumerate(yield_analysis['inversion_periods']):
-                        # 역전 구간 (연한 빨간색)
-                        fig_yield.add_vrect(
-                            x0=period['inversion_start'],
-                            x1=period['inversion_end'],
-                            fillcolor="rgba(255, 0, 0, 0.1)",
-                            layer="below",
-                            line_width=0,
-                            annotation_text=f"역전 {period['duration_days']}일" if i == 0 else "",
-                            annotation_position="top left"
-                        )
-                        
-                        # 6-18개월 후 경기침체 예상 구간 (진한 빨간색)
-                        if period['recession_period_start'] <= yield_data.index[-1]:
-                            fig_yield.add_vrect(
-                                x0=period['recession_period_start'],
-                                x1=min(period['recession_period_start'], yield_data.index[-1]),
-                                fillcolor="rgba(255, 0, 0, 0.3)",
-                                layer="below",
-                                line_width=0,
-                                annotation_text="침체 예상구간" if i == 0 else "",
-                                annotation_position="bottom left"
-                            )
-                
-                # 급격한 정상화 구간 하이라이트 (오렌지)
-                if yield_analysis['rapid_normalization_periods']:
-                    for period in yield_analysis['rapid_normalization_periods']:
-                        fig_yield.add_vrect(
-                            x0=period['start'],
-                            x1=period['end'],
-                            fillcolor="rgba(255, 165, 0, 0.4)",
-                            layer="below",
-                            line_width=0,
-                            annotation_text=f"급격한 정상화 (+{period['change']:.1f}%p)",
-                            annotation_position="top right"
-                        )
-                
-                # 현재 상태 포인트 강조
-                current_date = yield_data.index[-1]
-                current_value = yield_data.iloc[-1]
-                
-                color = "red" if current_value < 0 else "green"
-                fig_yield.add_trace(go.Scatter(
-                    x=[current_date],
-                    y=[current_value],
-                    mode='markers',
-                    name='현재 상태',
-                    marker=dict(color=color, size=10, symbol='diamond'),
-                    hovertemplate=f'현재: {current_value:.2f}%p<extra></extra>'
-                ))
-                
-                fig_yield.update_layout(
-                    title="일드커브 스프레드 추이 (10년 데이터)",
-                    xaxis_title="날짜",
-                    yaxis_title="스프레드 (%p)",
-                    height=400,
-                    showlegend=True,
-                    legend=dict(x=0.02, y=0.98),
-                    hovermode='x unified'
-                )
-                
-                # Y축 범위 조정
-                y_min = min(yield_data.min() - 0.5, -1)
-                y_max = max(yield_data.max() + 0.5, 3)
-                fig_yield.update_yaxes(range=[y_min, y_max])
-                
+                fig_yield = build_yield_fig(yield_data,
+                                            yield_analysis['inversion_periods'],
+                                            yield_analysis['rapid_normalization_periods'])
                 st.plotly_chart(fig_yield, use_container_width=True)
+    
+    if st.button("🔄 일드커브 새로고침", key="refresh_yield_curve"):
+        refresh_yield_curve_data()
+        rerun_after_refresh('yield_analysis', analyze_yield_curve_signal(get_yield_curve_data())[0])
+
+# 데이터 로드
+with st.spinner("데이터를 로드하는 중..."):
+    # 모든 원본 데이터를 병렬로 먼저 가져와 각 패널이 한 번씩 사용
+    st.session_state['prefetched'] = load_all_series()
+
+sofr_panel()
+st.markdown("---")
+pmi_panel()
+st.markdown("---")
+yield_curve_panel()
+
+# 사용되지 않은 프리페치 결과는 패널 단위 재실행에서 재사용되지 않도록 버림
+st.session_state.pop('prefetched', None)
 
 # 종합 위기 시그널
 st.markdown("---")
 st.subheader("🚨 종합 위기 시그널")
 
+# 각 패널이 마지막으로 계산한 분석 결과
+sofr_analysis = st.session_state.get('sofr_analysis')
+pmi_analysis = st.session_state.get('pmi_analysis')
+yield_analysis = st.session_state.get('yield_analysis')
+
 danger_signals = 0
 warning_signals = 0
 
@@ -664,5 +980,5 @@ st.caption("데이터 출처: FRED (Federal Reserve Economic Data)")
 
 # 새로고침 버튼
 if st.button("🔄 데이터 새로고침"):
-    st.cache_data.clear()
-    st.experimental_rerun()
+    refresh_stale_data()
+    st.rerun()